@@ -1,6 +1,12 @@
+# standard library
+import json
+import os
+
+
 # dependencies
 import numpy as np
-from xarray_custom import coord, dataarrayclass
+import pytest
+from xarray_custom import coord, dataarrayclass, include
 
 
 # constants
@@ -20,6 +26,16 @@ class Image:
     def normalize(self):
         return self / self.max()
 
+    def double(self):
+        return 2 * self.normalize()
+
+    @property
+    def peak(self):
+        return float(self.max())
+
+    def scaled(self):
+        return self / self.peak
+
 
 # test functions
 def test_dataarrayclass():
@@ -31,11 +47,32 @@ def test_dataarrayclass():
     assert (image == DATA).all()
 
 
+def test_dataarrayclass_data():
+    data = np.array([[0, 1], [2, 3]], DTYPE)
+    masked = np.ma.masked_array(data, [[0, 1], [0, 0]])
+
+    assert np.shares_memory(Image(data), data)
+    assert np.isnan(Image(masked)[0, 1])
+    assert Image(data.astype(int)).dtype == DTYPE
+
+
 def test_custom_methods():
     data = np.array([[0, 1], [2, 3]], DTYPE)
     image = Image(data, x=[0, 1], y=[0, 1])
 
     assert (image.img.normalize() == DATA / DATA.max()).all()
+    assert (image.img.double() == 2 * DATA / DATA.max()).all()
+    assert image.img.peak == DATA.max()
+    assert (image.img.scaled() == DATA / DATA.max()).all()
+
+
+def test_coord():
+    assert coord(DIMS[0], int) is coord(DIMS[0], int)
+    assert coord(list(DIMS), float) is coord(DIMS, float)
+    assert coord(DIMS[0], int) is not coord(DIMS[0], float)
+
+    dtype = [("a", "i4"), ("b", "f8")]
+    assert coord(DIMS[0], dtype).dtype == dtype
 
 
 def test_special_methods():
@@ -46,6 +83,44 @@ def test_special_methods():
     assert (Image.full(shape, 1) == np.full(shape, 1)).all()
 
 
+def test_special_methods_full():
+    shape = 2, 2
+    zeros = Image.full(shape, 0)
+    negative_zeros = Image.full(shape, -0.0)
+
+    assert zeros.dtype == DTYPE
+    assert (zeros == 0).all()
+    assert np.signbit(negative_zeros).all()
+
+
+def test_special_methods_binding():
+    class Volume(Image):
+        dims = "x", "y", "z"
+
+    shape = 2, 2, 2
+
+    assert Image.zeros.__self__ is Image
+    assert Volume.zeros.__self__ is Volume
+    assert Volume.zeros(shape).dims == Volume.dims
+    assert Volume.ones(shape).dims == Volume.dims
+
+
+def test_special_methods_dtype():
+    @dataarrayclass
+    class Record:
+        dims = "x"
+        dtype = [("a", "i4"), ("b", "f8")]
+
+    @dataarrayclass
+    class Label:
+        dims = "x"
+        dtype = str
+
+    assert Record.zeros(2).dtype == np.dtype(Record.dtype)
+    assert (Label.full(2, "abc") == "abc").all()
+    assert Image.zeros(2 * (2,), int).dtype == DTYPE
+
+
 def test_inheritance():
     class WeightedImage(Image):
         accessor = "wimg"
@@ -55,4 +130,141 @@ def test_inheritance():
     print(vars(WeightedImage))
 
     assert (image.w == np.ones_like(DATA)).all()
+
+    image.w.values[0, 0] = 2.0
+    assert image.w[0, 0] == 2.0
     assert (image.wimg.normalize() == DATA / DATA.max()).all()
+
+
+def test_inheritance_defaults():
+    class DefaultImage(Image):
+        w: coord(DIMS, float) = np.zeros(DATA.shape)
+
+    image = DefaultImage(DATA)
+    image.w.values[0, 0] = 2.0
+
+    assert (DefaultImage.w == 0).all()
+    assert (DefaultImage(DATA).w == 0).all()
+
+
+def test_custom_methods_added_later():
+    class LaterImage(Image):
+        accessor = "limg"
+
+    LaterImage.twice = lambda self: 2 * self
+    LaterImage.total = property(lambda self: float(self.sum()))
+    image = LaterImage(DATA)
+
+    assert (image.limg.twice() == 2 * DATA).all()
+    assert image.limg.total == DATA.sum()
+
+
+def test_custom_methods_reassigned():
+    class LaterImage(Image):
+        accessor = "rimg"
+
+        def twice(self):
+            return 2 * self
+
+    image = LaterImage(DATA)
+    LaterImage.twice = lambda self: 3 * self
+
+    assert (image.rimg.twice() == 3 * DATA).all()
+
+    del LaterImage.twice
+
+    with pytest.raises(AttributeError):
+        image.rimg.twice
+
+
+def test_common_accessor():
+    @dataarrayclass
+    class Spectrum:
+        dims = "ch"
+        accessor = "common"
+
+        def first(self):
+            return self[0]
+
+    @dataarrayclass
+    class Weights:
+        dims = "ch"
+        accessor = "common"
+
+        def last(self):
+            return self[-1]
+
+    Spectrum.total = lambda self: self.sum()
+    spectrum = Spectrum([1.0, 2.0])
+
+    assert spectrum.common.first() == 1.0
+    assert spectrum.common.last() == 2.0
+    assert spectrum.common.total() == 3.0
+    assert {"first", "last"} <= set(dir(spectrum.common))
+
+
+def test_cache_invalidation():
+    @dataarrayclass
+    class Base:
+        dims = "x"
+        x: coord("x", int) = 0
+
+    class Sub(Base):
+        pass
+
+    assert (Base([1]).x == 0).all()
+    assert (Sub([1]).x == 0).all()
+    assert "dims=('x',)" in str(Sub.zeros.__doc__)
+
+    Base.x = 7
+    assert (Base([1]).x == 7).all()
+    assert (Sub([1]).x == 7).all()
+
+    Base.dims = "t"
+    assert "dims=('t',)" in str(Base.zeros.__doc__)
+    assert "dims=('t',)" in str(Sub.zeros.__doc__)
+
+
+def test_include_cache(tmp_path, monkeypatch):
+    for name, default in (("a", 1), ("b", 2)):
+        (tmp_path / name).mkdir()
+        path = tmp_path / name / "dataarray.json"
+        config = {"dims": "x", "coords": {"x": {"default": [default]}}}
+        path.write_text(json.dumps(config))
+        os.utime(path, ns=(0, 0))
+
+    def create(name):
+        return include("dataarray.json")(dataarrayclass(type(name, (), {})))
+
+    monkeypatch.chdir(tmp_path / "a")
+    ImageA = create("ImageA")
+    ImageA.x.append(0)
+
+    assert create("ImageA").x == [1]
+
+    config = {"dims": "x", "coords": {"x": {"default": [10]}}}
+    (tmp_path / "a" / "dataarray.json").write_text(json.dumps(config))
+    os.utime(tmp_path / "a" / "dataarray.json", ns=(0, 0))
+    assert create("ImageA").x == [10]
+
+    monkeypatch.chdir(tmp_path / "b")
+    assert create("ImageB").x == [2]
+
+
+def test_include_formats(tmp_path):
+    texts = {
+        "json": '{"dims": "x", "coords": {"x": {"dims": "x", "default": 1}}}',
+        "toml": 'dims = "x"\n[coords.x]\ndims = "x"\ndefault = 1\n',
+        "yaml": "dims: x\ncoords:\n  x: {dims: x, default: 1}\n",
+        "yml": "dims: x\ncoords:\n  x: {dims: x, default: 1}\n",
+    }
+
+    for suffix, text in texts.items():
+        path = tmp_path / f"dataarray.{suffix}"
+        path.write_text(text)
+        Included = include(path)(dataarrayclass(type("Included", (), {})))
+
+        assert (Included.zeros(2).x == 1).all()
+
+    with pytest.raises(ValueError):
+        include(tmp_path / "dataarray.txt")
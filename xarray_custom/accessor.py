@@ -4,20 +4,20 @@ __all__ = ["add_accessors"]
 
 # standard library
 from collections import defaultdict
-from functools import lru_cache
-from itertools import chain
-from inspect import getsource, signature
-from re import sub
-from textwrap import dedent
-from types import FunctionType
-from typing import Any, Callable, List, Optional
-from uuid import uuid4
+from functools import lru_cache, update_wrapper
+from itertools import count
+from types import FunctionType, MethodType
+from typing import Any, Callable, Dict, List, Optional
 
 
 # dependencies
 from xarray import DataArray, register_dataarray_accessor
 
 
+# constants
+MISSING: object = object()
+
+
 # main features
 def add_accessors(cls: type, name: Optional[str] = None) -> type:
     """Add unique and common accessors to a DataArray class.
@@ -32,10 +32,16 @@ def add_accessors(cls: type, name: Optional[str] = None) -> type:
 
     """
 
-    class UniqueAccessor(UniqueAccessorBase):
-        _dataarrayclass = cls
+    namespace = dict(__slots__=(), _dataarrayclass=cls)
+
+    for key in get_functions(cls):
+        if not hasattr(UniqueAccessorBase, key):
+            namespace[key] = BoundAttribute(key)
+
+    type("UniqueAccessor", (UniqueAccessorBase,), namespace)
 
     class CommonAccessor(CommonAccessorBase):
+        __slots__ = ()
         _dataarrayclass = cls
         _name = name
 
@@ -46,7 +52,9 @@ def add_accessors(cls: type, name: Optional[str] = None) -> type:
 class CommonAccessorBase:
     """Base class for common accessors of DataArray classes."""
 
+    __slots__ = ("_dataarray",)
     _dataarrayclasses = defaultdict(list)
+    _owners = defaultdict(dict)
     _dataarrayclass: type
     _name: str
 
@@ -59,6 +67,10 @@ class CommonAccessorBase:
             register_dataarray_accessor(cls._name)(cls)
 
         cls._dataarrayclasses[cls._name].insert(0, cls._dataarrayclass)
+        owners = cls._owners[cls._name]
+
+        for name in dir(cls._dataarrayclass):
+            owners[name] = cls._dataarrayclass
 
     def __init__(self, dataarray: DataArray) -> None:
         """Initialize an instance with a DataArray to be accessed."""
@@ -66,63 +78,201 @@ class CommonAccessorBase:
 
     def __getattr__(self, name: str) -> Any:
         """Get a method or an attribute of the DataArray class."""
+        owner = self._owners[self._name].get(name)
+
+        if owner is not None:
+            value = getattr(owner._accessor(self._dataarray), name, MISSING)
+
+            if value is not MISSING:
+                return value
+
+        # attributes not in the table (e.g., added after the registration)
         for dataarrayclass in self._dataarrayclasses[self._name]:
-            bound = dataarrayclass._accessor(self._dataarray)
+            if dataarrayclass is owner:
+                continue
+
+            accessor = dataarrayclass._accessor(self._dataarray)
+            value = getattr(accessor, name, MISSING)
 
-            if hasattr(bound, name):
-                return getattr(bound, name)
+            if value is not MISSING:
+                return value
 
         raise AttributeError(f"Any DataArray class has no attribute {name!r}")
 
     def __dir__(self) -> List[str]:
         """List names in the union namespace of DataArray classes."""
-        dirs = map(dir, self._dataarrayclasses[self._name])
-        return list(set(chain.from_iterable(dirs)))
+        return list(self._owners[self._name])
 
 
 class UniqueAccessorBase:
     """Base class for unique accessors of DataArray classes."""
 
+    __slots__ = ("_dataarray",)
+    _ids = count()
     _dataarrayclass: type
     _name: str
 
     def __init_subclass__(cls) -> None:
-        """Initialize a subclass with a bound DataArray class."""
+        """Initialize a subclass with a bound DataArray class.
+
+        Custom functions and properties of the DataArray class are expected
+        to be in the namespace of the subclass as ``BoundAttribute``
+        descriptors so that they are found without ``__getattr__``.
+
+        """
         cls._dataarrayclass._accessor = cls
-        cls._name = "_accessor_" + uuid4().hex[:16]
+        cls._name = f"_accessor_{next(cls._ids):x}"
         register_dataarray_accessor(cls._name)(cls)
 
     def __init__(self, dataarray: DataArray) -> None:
         """Initialize an instance with a DataArray to be accessed."""
         self._dataarray = dataarray
 
-    @lru_cache(None)
-    def __bind_function(self, func: Callable) -> Callable:
-        """Convert a function to a method of an instance."""
-        first_arg = list(signature(func).parameters)[0]
-
-        pattern = rf"(?<!\w){first_arg}\."
-        repl = rf"{first_arg}.{self._name}."
-        source = dedent(getsource(func))
-
-        exec(sub(pattern, repl, source), func.__globals__, locals())
-        return locals()[func.__name__].__get__(self._dataarray)
-
     def __getattr__(self, name: str) -> Any:
-        """Get a method or an attribute of the DataArray class."""
+        """Get an attribute of the DataArray or the DataArray class."""
         try:
             return getattr(self._dataarray, name)
         except AttributeError:
             obj = getattr(self._dataarrayclass, name)
 
-        if isinstance(obj, FunctionType):
-            return self.__bind_function(obj)
-
-        if isinstance(obj, property):
-            return self.__bind_function(obj.fget)
-
-        return obj
+        # functions or properties added after the class creation
+        return bind(self, obj)
 
     def __dir__(self) -> List[str]:
         """List names in the namespace of the DataArray class."""
         return dir(self._dataarrayclass)
+
+
+class BoundAttribute:
+    """Descriptor to bind an attribute of a DataArray class to an accessor.
+
+    The attribute is looked up on the DataArray class on every access
+    so that it can be reassigned or deleted after the class creation.
+
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        """Initialize an instance with the name of an attribute."""
+        self.name = name
+
+    def __get__(self, accessor: Any, owner: Optional[type] = None) -> Any:
+        """Get the attribute bound to the accessed DataArray."""
+        if accessor is None:
+            return self
+
+        return bind(accessor, getattr(accessor._dataarrayclass, self.name))
+
+
+def bind(accessor: Any, obj: Any) -> Any:
+    """Bind a function or a property to the DataArray of an accessor.
+
+    A function is converted to a method of the accessed DataArray
+    and a property is evaluated with it. Other objects are returned as is.
+
+    """
+    if isinstance(obj, FunctionType):
+        func = rewrite_function(obj, accessor._name)
+        return MethodType(func, accessor._dataarray)
+
+    if isinstance(obj, property):
+        fget = rewrite_function(obj.fget, accessor._name)
+        return fget(accessor._dataarray)
+
+    return obj
+
+
+def get_functions(dataarrayclass: type) -> Dict[str, Any]:
+    """Get custom functions and properties of a DataArray class.
+
+    Special names (``__*__``) and names which are also attributes of
+    DataArray are excluded so that they are resolved by the accessed
+    DataArray first.
+
+    """
+    functions = {}
+
+    for cls in reversed(dataarrayclass.__mro__):
+        for name, obj in vars(cls).items():
+            if name.startswith("__") and name.endswith("__"):
+                continue
+
+            if hasattr(DataArray, name):
+                continue
+
+            if isinstance(obj, (FunctionType, property)):
+                functions[name] = obj
+            else:
+                functions.pop(name, None)
+
+    return functions
+
+
+@lru_cache(None)
+def rewrite_function(func: Callable, name: str) -> Callable:
+    """Rewrite attribute access on the first argument of a function.
+
+    An attribute of the first argument (e.g., ``self.attr``) is replaced
+    by that of an accessor (``self.<name>.attr``) so that other custom
+    functions of a DataArray class can be used inside the function.
+    The source is rewritten only once for each function and accessor.
+    If it is not available (e.g., lambdas or functions which use closures),
+    the function is returned as is.
+
+    """
+    # imported here since they are only needed for custom functions
+    import ast
+    from inspect import getsource
+    from textwrap import dedent
+
+    try:
+        tree = ast.parse(dedent(getsource(func)))
+    except (OSError, SyntaxError, TypeError):
+        return func
+
+    node = tree.body[0]
+    types = ast.FunctionDef, ast.AsyncFunctionDef
+
+    if not isinstance(node, types) or node.name != func.__name__:
+        return func
+
+    if func.__code__.co_freevars:
+        return func
+
+    args = getattr(node.args, "posonlyargs", []) + node.args.args
+
+    if not args:
+        return func
+
+    # decorators, defaults, and annotations are not evaluated again
+    # (those of the original function are copied instead)
+    node.decorator_list = []
+    node.returns = None
+    node.args.defaults = []
+    node.args.kw_defaults = [None] * len(node.args.kwonlyargs)
+
+    for child in ast.walk(node):
+        if isinstance(child, ast.arg):
+            child.annotation = None
+
+        if not isinstance(child, ast.Attribute):
+            continue
+
+        if not isinstance(child.ctx, ast.Load):
+            continue
+
+        if isinstance(child.value, ast.Name) and child.value.id == args[0].arg:
+            accessor = ast.Attribute(child.value, name, ast.Load())
+            child.value = ast.copy_location(accessor, child.value)
+
+    ast.increment_lineno(tree, func.__code__.co_firstlineno - 1)
+    code = compile(tree, func.__code__.co_filename, "exec")
+
+    namespace = {}
+    exec(code, func.__globals__, namespace)
+
+    rewritten = namespace[func.__name__]
+    rewritten.__defaults__ = func.__defaults__
+    rewritten.__kwdefaults__ = func.__kwdefaults__
+    return update_wrapper(rewritten, func)
@@ -3,9 +3,8 @@ __all__ = ["DataArrayClassBase"]
 
 
 # standard library
-from re import sub
-from itertools import chain
-from typing import get_type_hints, List, Optional
+import re
+from typing import get_type_hints, Any, Dict, List, Optional, Pattern
 from textwrap import TextWrapper
 
 
@@ -18,6 +17,7 @@ from .special import add_classmethods
 # constants
 DOC_WIDTH: int = 78
 DOC_INDENT: str = " " * 4
+WHITESPACE: Pattern = re.compile(r"\s+")
 
 
 class classproperty(property):
@@ -26,27 +26,55 @@ class classproperty(property):
     pass
 
 
+class cachedclassproperty(classproperty):
+    """Decorator to convert a function as a cached class property.
+
+    The value is stored in the cache of a DataArray class,
+    which is cleared when an attribute of the class is updated.
+
+    """
+
+    def __get__(self, cls: Any, meta: Optional[type] = None) -> Any:
+        """Get the cached value or compute and cache it."""
+        if cls is None:
+            return self
+
+        cache, key = cls._cache, self.fget.__name__
+
+        if key not in cache:
+            cache[key] = super().__get__(cls, meta)
+
+        return cache[key]
+
+
 class DataArrayClassMeta(type):
     """Metaclass only for the ``DataArrayClassBase`` class."""
 
     def __new__(meta, name: str, bases: tuple, namespace: dict) -> type:
         """Create a DataArray class as an instance of the metaclass.
 
-        This method (1) convert instance methods to class properties
-        and (2) use the class ``__doc__`` as the ``desc`` attribute.
+        This method (1) convert instance methods to class properties,
+        (2) use the class ``__doc__`` as the ``desc`` attribute,
+        and (3) adds an empty cache of class-specific values.
 
         """
-        for key, obj in namespace.copy().items():
+        attrs = {}
+
+        for key, obj in namespace.items():
             if isinstance(obj, classproperty):
                 setattr(meta, key, obj)
-                namespace.pop(key)
+            else:
+                attrs[key] = obj
 
-        if isinstance(namespace.get("dims"), str):
-            namespace["dims"] = (namespace["dims"],)
+        namespace = attrs
+
+        if "dims" in namespace:
+            namespace["dims"] = normalize_dims(namespace["dims"])
 
         if namespace.get("__doc__") and not namespace.get("desc"):
             namespace["desc"] = namespace["__doc__"]
 
+        namespace["_cache"] = {}
         return super().__new__(meta, name, bases, namespace)
 
     def __init__(cls, name: str, bases: tuple, namespace: dict) -> None:
@@ -54,15 +82,34 @@ class DataArrayClassMeta(type):
 
         This method (1) adds special class methods (e.g., ``__new__``, ``ones``)
         with a docstring updater and (2) adds unique and common accessors.
+        Formatted docstrings are stored in the cache of the class.
 
         """
 
         def updater(doc):
-            return doc.format(cls=cls)
+            docs = cls._cache.setdefault("docs", {})
+
+            if doc not in docs:
+                docs[doc] = doc.format(cls=cls)
+
+            return docs[doc]
 
         add_classmethods(cls, updater)
         add_accessors(cls, cls.accessor)
 
+    def __setattr__(cls, name: str, value: Any) -> None:
+        """Set an attribute and clear the caches of a DataArray class."""
+        if name == "dims":
+            value = normalize_dims(value)
+
+        super().__setattr__(name, value)
+        clear_caches(cls)
+
+    def __delattr__(cls, name: str) -> None:
+        """Delete an attribute and clear the caches of a DataArray class."""
+        super().__delattr__(name)
+        clear_caches(cls)
+
     def __repr__(cls) -> str:
         """Customizable repr feature of a DataArray class.
 
@@ -77,8 +124,26 @@ class DataArrayClassMeta(type):
 
     def __dir__(cls) -> List[str]:
         """List names in the namespace of a DataArray class."""
-        dirs = super().__dir__(), dir(type(cls))
-        return list(set(chain.from_iterable(dirs)))
+        return list({*super().__dir__(), *dir(type(cls))})
+
+
+def clear_caches(cls: type) -> None:
+    """Clear the caches of a DataArray class and all of its subclasses."""
+    cls._cache.clear()
+
+    for subclass in cls.__subclasses__():
+        clear_caches(subclass)
+
+
+def normalize_dims(dims: Optional[Dims]) -> Optional[Dims]:
+    """Convert dimensions given as a string or a list to a tuple."""
+    if isinstance(dims, str):
+        return (dims,)
+
+    if isinstance(dims, list):
+        return tuple(dims)
+
+    return dims
 
 
 class DataArrayClassBase(metaclass=DataArrayClassMeta):
@@ -89,11 +154,11 @@ class DataArrayClassBase(metaclass=DataArrayClassMeta):
     dtype: Optional[Dtype] = None
     accessor: Optional[str] = None
 
-    @classproperty
+    @cachedclassproperty
     def doc(cls) -> "Doc":
         return Doc.from_dataarrayclass(cls)
 
-    @classproperty
+    @cachedclassproperty
     def coords(cls) -> "Coords":
         """Dictionary of coordinate definitions."""
         return Coords.from_dataarrayclass(cls)
@@ -108,20 +173,30 @@ class Coords(dict):
     """Class for the coordinate definitions of a DataArray class."""
 
     wrapper = TextWrapper(DOC_WIDTH, DOC_INDENT, DOC_INDENT * 2)
+    defaults: Dict[str, Any]
 
     @classmethod
     def from_dataarrayclass(cls, dataarrayclass: type) -> "Coords":
-        """Create a Coords instance from a DataArray class."""
-        coords = {}
+        """Create a Coords instance from a DataArray class.
+
+        Default values of the coordinates (class attributes of the same
+        names) are also resolved and stored in the ``defaults`` attribute.
+
+        """
+        coords, defaults = {}, {}
 
         for name, hint in get_type_hints(dataarrayclass).items():
-            if not isinstance(hint, type):
+            if not isinstance(hint, DataArrayClassMeta):
                 continue
 
-            if issubclass(hint, DataArrayClassBase):
-                coords[name] = hint
+            coords[name] = hint
+
+            if hasattr(dataarrayclass, name):
+                defaults[name] = getattr(dataarrayclass, name)
 
-        return cls(coords)
+        instance = cls(coords)
+        instance.defaults = defaults
+        return instance
 
     @property
     def doc(self) -> str:
@@ -145,12 +220,15 @@ class Doc(str):
 
     def __new__(cls, doc: str) -> "Doc":
         """Create an instance from a docstring."""
-        return super().__new__(cls, "\n".join(cls.wrapper.wrap(doc)))
+        unwrap = WHITESPACE.sub(" ", doc).strip()
+        self = super().__new__(cls, "\n".join(cls.wrapper.wrap(unwrap)))
+        self._unwrap = unwrap
+        return self
 
     @classmethod
     def from_dataarrayclass(cls, dataarrayclass: type) -> "Doc":
         """Create an Doc instace from a DataArray class."""
-        desc = sub(r"[\n|\s]+", " ", dataarrayclass.desc)
+        desc = dataarrayclass.desc
         dims = f"dims={dataarrayclass.dims!r}"
         dtype = f"dtype={dataarrayclass.dtype!r}"
 
@@ -159,4 +237,4 @@ class Doc(str):
     @property
     def unwrap(self):
         """Convert an instance to an unwrap docstring."""
-        return sub(r"[\n|\s]+", " ", self)
+        return self._unwrap
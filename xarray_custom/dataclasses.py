@@ -86,6 +86,7 @@ __all__ = ["coord", "dataarrayclass"]
 
 
 # standard library
+from functools import lru_cache
 from typing import Optional
 
 
@@ -110,18 +111,26 @@ def coord(
         desc: Short description of the coordinate.
 
     Returns:
-        DataArray class for the coordinate.
+        DataArray class for the coordinate. The same class is
+        returned for the same combination of the arguments and is
+        shared by any DataArray classes using it. Therefore it should
+        not be modified (e.g., by setting attributes) after creation.
+        If any argument is unhashable (e.g., a structured dtype given
+        as a list), a new class is created every time.
 
     """
     if dims is None:
         dims = ()
 
-    if desc is None:
-        namespace = dict(dims=dims, dtype=dtype)
-    else:
-        namespace = dict(dims=dims, dtype=dtype, desc=desc)
+    if isinstance(dims, list):
+        dims = tuple(dims)
 
-    return type("Coord", (DataArrayClassBase,), namespace)
+    try:
+        hash((dims, dtype, desc))
+    except TypeError:
+        return create_coord.__wrapped__(dims, dtype, desc)
+
+    return create_coord(dims, dtype, desc)
 
 
 def dataarrayclass(cls: type) -> type:
@@ -167,3 +176,15 @@ def dataarrayclass(cls: type) -> type:
 
     """
     return type(cls.__name__, (DataArrayClassBase,), cls.__dict__.copy())
+
+
+# helper functions
+@lru_cache(None)
+def create_coord(dims: Dims, dtype: Optional[Dtype], desc: Optional[str]) -> type:
+    """Create a DataArray class for a coordinate (cached by arguments)."""
+    if desc is None:
+        namespace = dict(dims=dims, dtype=dtype)
+    else:
+        namespace = dict(dims=dims, dtype=dtype, desc=desc)
+
+    return type("Coord", (DataArrayClassBase,), namespace)
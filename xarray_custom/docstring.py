@@ -3,8 +3,9 @@ __all__ = ["updatable_doc"]
 
 
 # standard library
-from functools import wraps
+from functools import update_wrapper
 from textwrap import dedent
+from types import FunctionType
 from typing import Callable
 
 
@@ -39,12 +40,18 @@ def updatable_doc(func: Callable) -> Callable:
 
     """
 
-    @wraps(func)
-    def decorated(*args, **kwargs):
-        return func(*args, **kwargs)
+    decorated = FunctionType(
+        func.__code__,
+        func.__globals__,
+        func.__name__,
+        func.__defaults__,
+        func.__closure__,
+    )
+    decorated.__kwdefaults__ = func.__kwdefaults__
+    update_wrapper(decorated, func)
 
     def copy(self):
-        return updatable_doc(self)
+        return updatable_doc(func)
 
     def set(self, updater):
         self.__doc__.updater = updater
@@ -66,6 +73,8 @@ class UpdatableDoc(str):
 
     """
 
+    __slots__ = ("updater",)
+
     def __new__(cls, doc: str) -> "UpdatableDoc":
         """Create an instance from a docstring."""
         return super().__new__(cls, cls.dedent(doc))
@@ -3,6 +3,7 @@ __all__ = ["add_classmethods"]
 
 
 # standard library
+from types import MethodType
 from typing import Any, Callable, Optional
 
 
@@ -32,10 +33,12 @@ def add_classmethods(cls: type, updater: Optional[Callable] = None) -> type:
     """
     cls.__new__ = new.copy().set(updater)
 
-    cls.empty = classmethod(empty.copy().set(updater))
-    cls.zeros = classmethod(zeros.copy().set(updater))
-    cls.ones = classmethod(ones.copy().set(updater))
-    cls.full = classmethod(full.copy().set(updater))
+    # class methods are bound to the class once here
+    # (not by classmethod every time they are accessed)
+    cls.empty = MethodType(empty.copy().set(updater), cls)
+    cls.zeros = MethodType(zeros.copy().set(updater), cls)
+    cls.ones = MethodType(ones.copy().set(updater), cls)
+    cls.full = MethodType(full.copy().set(updater), cls)
 
     return cls
 
@@ -56,9 +59,13 @@ def new(
         data: Values of the DataArray. Its shape must match class ``dims``.
             If class ``dtype`` is defined, it will be casted to that type.
             If it cannot be casted, a ``ValueError`` will be raised.
+            A NumPy array is not copied if it already has that type,
+            i.e., the DataArray shares the memory with the array.
         name: Name of the DataArray. Default is class ``name``.
         attrs: Attributes of the DataArray. Default is class ``attrs``.
         **coords: Coordinates of the DataArray defined by the class.
+            Like ``data``, a NumPy array of the coordinate shape
+            and datatype is not copied. Class defaults are always copied.
 
     Returns:
         Custom DataArray.
@@ -66,27 +73,54 @@ def new(
     {cls.coords.doc}
 
     """
+    if cls.dtype is not None and is_numpy_like(data):
+        data = np.asarray(data, cls.dtype)
+
     dataarray = DataArray(data, dims=cls.dims, name=name, attrs=attrs)
 
-    if cls.dtype is not None:
+    if cls.dtype is not None and dataarray.dtype != cls.dtype:
         dataarray = dataarray.astype(cls.dtype)
 
-    for name, coord in cls.coords.items():
-        shape = [dataarray.sizes[dim] for dim in coord.dims]
+    if not cls.coords:
+        return dataarray
 
-        if name in coords:
-            dataarray.coords[name] = coord.full(shape, coords[name])
-            continue
+    sizes = dict(zip(dataarray.dims, dataarray.shape))
+    shapes, defaults = {}, cls.coords.defaults
+    new_coords = {}
+
+    for name, coord in cls.coords.items():
+        dims = coord.dims
 
-        if hasattr(cls, name):
-            dataarray.coords[name] = coord.full(shape, getattr(cls, name))
-            continue
+        if dims not in shapes:
+            shapes[dims] = tuple(sizes[dim] for dim in dims)
 
-        raise ValueError(
-            f"Default value for a coordinate {name} is not defined. "
-            f"It must be given as a keyword argument ({name}=<value>)."
-        )
+        shape = shapes[dims]
 
+        # a default value is always copied so that it is
+        # not modified through the coordinates of a DataArray
+        if name in coords:
+            values = np.asarray(coords[name], coord.dtype)
+        elif name in defaults:
+            values = np.array(defaults[name], coord.dtype)
+        else:
+            raise ValueError(
+                f"Default value for a coordinate {name} is not defined. "
+                f"It must be given as a keyword argument ({name}=<value>)."
+            )
+
+        # a scalar value is filled into a new (writable) array
+        # and an array of the coordinate shape is used as is
+        if values.shape != shape:
+            values = np.full(shape, values)
+
+        # a coordinate without its own coordinates is
+        # created directly, not via the DataArray class
+        if coord.coords:
+            new_coords[name] = coord(values)
+        else:
+            new_coords[name] = coord.dims, values
+
+    dataarray.coords.update(new_coords)
     return dataarray
 
 
@@ -120,6 +154,7 @@ def empty(
     {cls.coords.doc}
 
     """
+    dtype = get_dtype(cls, dtype)
     return cls(np.empty(shape, dtype, order), name, attrs, **coords)
 
 
@@ -153,6 +188,7 @@ def zeros(
     {cls.coords.doc}
 
     """
+    dtype = get_dtype(cls, dtype)
     return cls(np.zeros(shape, dtype, order), name, attrs, **coords)
 
 
@@ -186,6 +222,7 @@ def ones(
     {cls.coords.doc}
 
     """
+    dtype = get_dtype(cls, dtype)
     return cls(np.ones(shape, dtype, order), name, attrs, **coords)
 
 
@@ -221,4 +258,38 @@ def full(
     {cls.coords.doc}
 
     """
-    return cls(np.full(shape, fill_value, dtype, order), name, attrs, **coords)
+    dtype = get_dtype(cls, dtype)
+    value = np.asarray(fill_value, dtype)
+
+    # an all-zero fill value uses lazily zeroed (calloc) memory
+    if value.ndim == 0 and not any(value.tobytes()):
+        data = np.zeros(shape, value.dtype, order)
+    else:
+        data = np.full(shape, fill_value, dtype, order)
+
+    return cls(data, name, attrs, **coords)
+
+
+# helper functions
+def get_dtype(cls: type, dtype: Optional[Dtype] = None) -> Optional[Dtype]:
+    """Get the datatype of data to be allocated for a DataArray class.
+
+    The class ``dtype`` is preferred so that data are not casted again
+    after the allocation. A flexible one (e.g., ``str``) is not used,
+    however, since its itemsize is determined by the data.
+
+    """
+    if cls.dtype is None or np.dtype(cls.dtype).itemsize == 0:
+        return dtype
+
+    return cls.dtype
+
+
+def is_numpy_like(data: Any) -> bool:
+    """Check if data is a NumPy array or a non-array object (e.g., list).
+
+    Subclasses of NumPy array (e.g., masked arrays) are not included
+    so that they are converted by xarray (e.g., masks to NaN).
+
+    """
+    return type(data) is np.ndarray or not hasattr(data, "__array__")
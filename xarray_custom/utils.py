@@ -11,14 +11,13 @@ __all__ = ["include"]
 
 # standard library
 import json
-import re
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict, Union
 
 
 # dependencies
-import toml
-import yaml
 from .dataclasses import coord
 
 
@@ -31,9 +30,6 @@ ATTRS = (
 )
 COORDS = "coords"
 DEFAULT = "default"
-JSON_RE = r"\.json$"
-TOML_RE = r"\.toml$"
-YAML_RE = r"\.ya?ml$"
 
 
 # main functions
@@ -102,19 +98,24 @@ def include(path: Union[Path, str]) -> Callable:
     loader = choose_loader_from(path)
 
     def decorator(cls: type) -> type:
-        config = loader(path)
+        resolved = path.resolve()
+        stat = resolved.stat()
+        config = load_config(loader, resolved, stat.st_mtime_ns, stat.st_size)
+        config = deepcopy(config)
         coords = config.get(COORDS, {})
+        annotations = dict(vars(cls).get("__annotations__", {}))
 
         for name in ATTRS:
             if name in config:
                 setattr(cls, name, config[name])
 
         for name, values in coords.items():
-            cls.__annotations__[name] = coord(**values)
+            annotations[name] = coord(**values)
 
             if DEFAULT in values:
                 setattr(cls, name, values[DEFAULT])
 
+        cls.__annotations__ = annotations
         return cls
 
     return decorator
@@ -123,14 +124,26 @@ def include(path: Union[Path, str]) -> Callable:
 # helper functions
 def choose_loader_from(path: Path) -> Callable:
     """Choose file loader based on a filename."""
-    if re.search(JSON_RE, path.name):
-        return load_json
-    elif re.search(TOML_RE, path.name):
-        return load_toml
-    elif re.search(YAML_RE, path.name):
-        return load_yaml
-    else:
-        raise ValueError("Invalid file format.")
+    try:
+        return LOADERS[path.suffix]
+    except KeyError:
+        raise ValueError("Invalid file format.") from None
+
+
+@lru_cache(None)
+def load_config(
+    loader: Callable,
+    path: Path,
+    mtime: int,
+    size: int,
+) -> Dict[str, Any]:
+    """Load a file with a loader (cached by path, modification time and size).
+
+    The cached dictionary is shared by all calls and should not be
+    modified. Copy it before use if necessary.
+
+    """
+    return loader(path)
 
 
 def load_json(path: Path) -> Dict[str, Any]:
@@ -141,10 +154,32 @@ def load_json(path: Path) -> Dict[str, Any]:
 
 def load_toml(path: Path) -> Dict[str, Any]:
     """Load a TOML file to create a dictionary."""
-    return toml.load(path)
+    # use the standard library parser (Python 3.11+) if available
+    try:
+        import tomllib
+    except ImportError:
+        import toml
+
+        return toml.load(path)
+
+    with path.open("rb") as f:
+        return tomllib.load(f)
 
 
 def load_yaml(path: Path) -> Dict[str, Any]:
     """Load a YAML file to create a dictionary."""
+    import yaml
+
+    # use the libyaml-based loader if PyYAML is built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     with path.open() as f:
-        return yaml.load(f, Loader=yaml.SafeLoader)
+        return yaml.load(f, Loader=loader)
+
+
+LOADERS: Dict[str, Callable] = {
+    ".json": load_json,
+    ".toml": load_toml,
+    ".yaml": load_yaml,
+    ".yml": load_yaml,
+}